@@ -2,17 +2,44 @@
 # Base Account class for SecureBank application.
 # Implements core attributes and methods for all account types.
 
+import heapq
+import itertools
+import time
+
+from ledger import HashChain, posting_key
+
 class Account:
-    def __init__(self, name, account_number, balance=0.0):
+    def __init__(self, name, account_number, balance=0.0, overdraft_limit=0.0, currency="USD"):
         """
         Initialize a new account with customer details.
         Private attributes are used for balance and account number 
         to demonstrate encapsulation.
+        The overdraft limit is how far below zero the balance may go.
+        All amounts on the account are in its currency.
+        Raises ValueError for a negative overdraft limit.
         """
+        if overdraft_limit < 0:
+            raise ValueError("Overdraft limit cannot be negative.")
+
         self.name = name
         self.__account_number = account_number   # Private attribute
         self.__balance = balance                 # Private attribute
-        self.transactions = []                   # Stores history of deposits and withdrawals
+        self.overdraft_limit = overdraft_limit   # Credit line available below zero
+        self.currency = currency.upper()         # ISO currency code, e.g. "USD"
+        # Hash-chained history of deposits and withdrawals; read it through
+        # the 'transactions' property, which cannot be edited
+        self.__history = HashChain(encode=str.encode)
+        self.__ledger = None                     # Bank-wide chain, set by Bank.add_account
+        self.__ledger_key = None                 # Account prefix for ledger postings
+        self.__ledger_position = None            # Index of the latest posting on the ledger
+
+        # Holds (authorisations) reserve funds without moving the balance.
+        # The running total keeps available-balance checks O(1); the heap
+        # orders holds by expiry so expired ones are dropped lazily.
+        self.__holds = {}                        # hold_id -> (amount, expires_at)
+        self.__held_total = 0.0
+        self.__hold_expiry = []                  # heap of (expires_at, hold_id)
+        self.__hold_ids = itertools.count(1)
 
     # --------------------------
     # Encapsulation: Getter methods
@@ -29,6 +56,23 @@ class Account:
         """
         return self.__balance
 
+    def get_available_balance(self):
+        """
+        Returns the amount that can still be spent:
+        balance plus overdraft limit, minus funds reserved by active holds.
+        """
+        if self.__hold_expiry:
+            self.expire_holds()
+        return self.__balance + self.overdraft_limit - self.__held_total
+
+    def get_held_amount(self):
+        """
+        Returns the total amount reserved by active holds.
+        """
+        if self.__hold_expiry:
+            self.expire_holds()
+        return self.__held_total
+
     # --------------------------
     # Core account functions
     # --------------------------
@@ -36,52 +80,246 @@ class Account:
         """
         Deposit money into the account if amount is valid.
         Updates balance and logs the transaction.
+        Returns True if the deposit went through, False otherwise.
         """
         if amount <= 0:
             print("Deposit amount must be positive.")
-            return
+            return False
 
         self.__balance += amount
-        self.transactions.append(f"Deposited: {amount}")
+        self.__post(f"Deposited: {amount}")
         print(f"Successfully deposited {amount}. New balance: {self.__balance}")
+        return True
 
     def withdraw(self, amount):
         """
         Withdraw money from the account.
         Checks for sufficient funds and logs the transaction.
+        Returns True if the withdrawal went through, False otherwise.
         """
         if amount <= 0:
             print("Withdrawal amount must be positive.")
-            return
+            return False
 
-        if amount > self.__balance:
+        if amount > self.get_available_balance():
             print("Insufficient funds. Transaction cancelled.")
-            return
+            return False
 
         self.__balance -= amount
-        self.transactions.append(f"Withdrew: {amount}")
+        self.__post(f"Withdrew: {amount}")
         print(f"Successfully withdrew {amount}. New balance: {self.__balance}")
+        return True
+
+    # --------------------------
+    # Holds / authorisations
+    # --------------------------
+    def place_hold(self, amount, ttl=None, hold_id=None):
+        """
+        Reserve funds for a pending payment (e.g. a card authorisation).
+        The hold expires after 'ttl' seconds if given.
+        Returns the hold id, or None if the hold was declined.
+        """
+        if amount <= 0:
+            print("Hold amount must be positive.")
+            return None
+
+        if ttl is not None and ttl <= 0:
+            print("Hold expiry time must be positive.")
+            return None
+
+        if amount > self.get_available_balance():
+            print("Insufficient funds. Hold declined.")
+            return None
+
+        if hold_id is None:
+            # Skip generated ids already taken by caller-supplied ones
+            hold_id = f"{self.__account_number}-H{next(self.__hold_ids)}"
+            while hold_id in self.__holds:
+                hold_id = f"{self.__account_number}-H{next(self.__hold_ids)}"
+        elif hold_id in self.__holds:
+            print(f"Hold {hold_id} already exists.")
+            return None
+
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        self.__holds[hold_id] = (amount, expires_at)
+        self.__held_total += amount
+        if expires_at is not None:
+            heapq.heappush(self.__hold_expiry, (expires_at, hold_id))
+
+        self.__post(f"Hold Placed: {amount} ({hold_id})")
+        print(f"Hold {hold_id} of {amount} placed. Available balance: {self.get_available_balance()}")
+        return hold_id
+
+    def __remove_hold(self, hold_id):
+        """
+        Drop a hold from the index and return its amount.
+        """
+        amount, _ = self.__holds.pop(hold_id)
+        self.__held_total -= amount
+        if not self.__holds:
+            # Reset to avoid accumulating floating point drift
+            self.__held_total = 0.0
+            self.__hold_expiry.clear()
+        return amount
+
+    def release_hold(self, hold_id):
+        """
+        Cancel a hold and return its funds to the available balance.
+        Returns True if the hold was active, False otherwise.
+        """
+        # Sweep first so a lapsed hold is logged as expired, not released
+        if self.__hold_expiry:
+            self.expire_holds()
+
+        if hold_id not in self.__holds:
+            print(f"Hold {hold_id} not found or expired.")
+            return False
+
+        amount = self.__remove_hold(hold_id)
+        self.__post(f"Hold Released: {amount} ({hold_id})")
+        print(f"Hold {hold_id} of {amount} released.")
+        return True
+
+    def capture_hold(self, hold_id, amount=None):
+        """
+        Settle a hold by debiting the account.
+        Captures the full held amount unless a different amount is given;
+        any increase over the hold must fit in the available balance.
+        Returns True if the capture went through, False otherwise.
+        """
+        # Sweep first so a lapsed hold cannot vanish between the checks below
+        if self.__hold_expiry:
+            self.expire_holds()
+
+        if hold_id not in self.__holds:
+            print(f"Hold {hold_id} not found or expired.")
+            return False
+
+        held, _ = self.__holds[hold_id]
+        if amount is None:
+            amount = held
+
+        if amount <= 0:
+            print("Capture amount must be positive.")
+            return False
+
+        if amount - held > self.get_available_balance():
+            print("Insufficient funds to capture hold. Transaction cancelled.")
+            return False
+
+        self.__remove_hold(hold_id)
+        self.__balance -= amount
+        self.__post(f"Hold Captured: {amount} ({hold_id})")
+        print(f"Hold {hold_id} captured for {amount}. New balance: {self.__balance}")
+        return True
+
+    def expire_holds(self, now=None):
+        """
+        Release every hold whose expiry time has passed.
+        Each hold is pushed and popped from the expiry heap once, so the
+        cost is amortised O(log n) per hold regardless of how often this runs.
+        Returns the number of holds that expired.
+        """
+        if now is None:
+            now = time.monotonic()
+
+        expired = 0
+        while self.__hold_expiry and self.__hold_expiry[0][0] <= now:
+            expires_at, hold_id = heapq.heappop(self.__hold_expiry)
+            entry = self.__holds.get(hold_id)
+            # Skip heap entries for holds already released or captured
+            if entry is None or entry[1] != expires_at:
+                continue
+            amount = self.__remove_hold(hold_id)
+            self.__post(f"Hold Expired: {amount} ({hold_id})")
+            expired += 1
+        return expired
 
     # --------------------------
     # Transaction History
     # --------------------------
+    @property
+    def transactions(self):
+        """
+        Returns the transaction history as a read-only tuple.
+        """
+        return tuple(self.__history)
+
+    def __post(self, message):
+        """
+        Chain a message onto the account history and, once the account
+        belongs to a bank, onto the bank-wide ledger as well.
+        """
+        digest = self.__history.append(message)
+        if self.__ledger is not None:
+            self.__ledger.append(self.__ledger_key + digest)
+            self.__ledger_position = len(self.__ledger) - 1
+
     def add_transaction(self, message):
         """
         Append a custom message to the transaction history.
         Useful for subclasses (Savings, Checking).
         """
-        self.transactions.append(message)
+        self.__post(message)
+
+    def attach_ledger(self, ledger):
+        """
+        Link the account to a bank-wide hash chain.
+        Postings made before the account joined the bank are replayed
+        onto the ledger so it covers the full history.
+        """
+        self.__ledger = ledger
+        self.__ledger_key = posting_key(self.__account_number)
+        for digest in self.__history.get_hashes():
+            ledger.append(self.__ledger_key + digest)
+        if self.__history:
+            self.__ledger_position = len(ledger) - 1
+
+    def get_ledger_position(self):
+        """
+        Returns the index of the account's latest posting on the bank ledger,
+        or None if nothing has been posted there.
+        """
+        return self.__ledger_position
+
+    def get_history(self):
+        """
+        Returns the hash chain behind the transaction history,
+        for auditors to read hashes and checkpoints from.
+        """
+        return self.__history
+
+    def verify_history(self, full=False):
+        """
+        Check the transaction history for tampering.
+        By default only entries after the latest checkpoint are recomputed;
+        full=True rechecks every entry and every checkpoint.
+        Returns True if the history is intact.
+        """
+        if full:
+            bad = self.__history.find_tampered()
+            if bad is None:
+                cp = self.__history.verify_checkpoints()
+                if cp is not None:
+                    bad = cp.start
+        else:
+            bad = self.__history.verify()
+
+        if bad is not None:
+            print(f"Account {self.__account_number}: history tampered at entry {bad}.")
+            return False
+        return True
 
     def show_transactions(self):
         """
         Display all past transactions in a formatted manner.
         """
-        if not self.transactions:
+        if not len(self.__history):
             print("No transactions available.")
             return
 
         print("\nTransaction History:")
-        for t in self.transactions:
+        for t in self.__history:
             print("-", t)
 
     # --------------------------
@@ -92,4 +330,4 @@ class Account:
         String representation of the account object.
         Helps when listing accounts in the Bank class.
         """
-        return f"Account Holder: {self.name}, Account Number: {self.__account_number}, Balance: {self.__balance}"
+        return f"Account Holder: {self.name}, Account Number: {self.__account_number}, Balance: {self.__balance} {self.currency}"
@@ -3,28 +3,52 @@
 # to add, retrieve, and list accounts in the SecureBank system.
 
 from account import Account
+from fx import FXRates
+from ledger import DIGEST_SIZE, HashChain, posting_key
 
 class Bank:
-    def __init__(self):
+    def __init__(self, base_currency=None, fx_rates=None):
         """
         Initialize the bank with an empty dictionary of accounts.
         Keys will be account numbers, values will be Account objects.
+        Reports are produced in the base currency using the FX rate table.
+        The base currency defaults to the rate table's base (or USD).
+        Raises ValueError if it differs from the rate table's base.
         """
+        if fx_rates is None:
+            fx_rates = FXRates(base_currency or "USD")
+        elif base_currency is not None and base_currency.upper() != fx_rates.base_currency:
+            raise ValueError(
+                f"Base currency {base_currency.upper()} does not match "
+                f"FX rate table base {fx_rates.base_currency}."
+            )
+
         self.accounts = {}
+        self.fx = fx_rates
+        self.base_currency = self.fx.base_currency
+        self.ledger = HashChain(checkpoint_interval=10000)  # Bank-wide chain of all postings
 
     def add_account(self, account):
         """
         Add a new account to the bank.
         Each account is stored using its account number as the key.
+        Returns True if the account was added, False if the number is taken
+        or the account's currency has no FX rate loaded.
         """
         acc_num = account.get_account_number()
 
         if acc_num in self.accounts:
             print("An account with this number already exists.")
-            return
+            return False
+
+        if account.currency not in self.fx.currencies():
+            print(f"No FX rate loaded for {account.currency}. Account not added.")
+            return False
 
         self.accounts[acc_num] = account
+        account.attach_ledger(self.ledger)
         print(f"Account for {account.name} added successfully.")
+        return True
 
     def get_account(self, account_number):
         """
@@ -47,3 +71,127 @@ class Bank:
             print(account)  # Calls __str__() from Account or subclasses
         print("------------------------------")
 
+    # --------------------------
+    # Audit
+    # --------------------------
+    def verify_ledger(self, full=False, workers=None):
+        """
+        Check the bank-wide ledger and every account history for tampering.
+        By default only entries after the latest checkpoint of each chain are
+        recomputed, and each account's head hash is compared with its latest
+        ledger posting. That catches any rewrite that changes an account's
+        hashes, but an edited payload left inside an already checkpointed
+        range is only found by a full check.
+        full=True rechecks the whole ledger across a process pool of
+        'workers' processes, every Merkle checkpoint, every account history,
+        and compares each account's hashes with all of its ledger postings.
+        Returns True if everything is intact.
+        """
+        if full:
+            bad = self.ledger.verify_full(workers)
+            if bad is None:
+                cp = self.ledger.verify_checkpoints()
+                if cp is not None:
+                    bad = cp.start
+        else:
+            bad = self.ledger.verify()
+
+        if bad is not None:
+            print(f"Bank ledger tampered at posting {bad}.")
+            return False
+
+        # Check every account even after a failure so all are reported
+        if full:
+            postings = {}
+            for posting in self.ledger:
+                key = posting[:-DIGEST_SIZE]
+                postings.setdefault(key, []).append(posting[-DIGEST_SIZE:])
+            intact = [
+                account.verify_history(full=True) and self.__matches_ledger(account, postings)
+                for account in self.accounts.values()
+            ]
+        else:
+            intact = [
+                account.verify_history() and self.__matches_ledger(account)
+                for account in self.accounts.values()
+            ]
+        return all(intact)
+
+    def __matches_ledger(self, account, postings=None):
+        """
+        Compare an account's hash chain with its postings on the bank ledger.
+        With 'postings' (ledger digests grouped by account prefix) every hash
+        is compared; otherwise only the account's head hash is.
+        Returns True if they agree.
+        """
+        history = account.get_history()
+        key = posting_key(account.get_account_number())
+
+        if postings is not None:
+            matches = postings.get(key, []) == history.get_hashes()
+        elif not len(history):
+            matches = account.get_ledger_position() is None
+        else:
+            position = account.get_ledger_position()
+            matches = (
+                position is not None and position < len(self.ledger)
+                and self.ledger[position] == key + history.head()
+            )
+
+        if not matches:
+            print(f"Account {account.get_account_number()}: history does not match the bank ledger.")
+        return matches
+
+    # --------------------------
+    # Multi-currency operations
+    # --------------------------
+    def transfer(self, from_number, to_number, amount):
+        """
+        Move money between two accounts.
+        The amount is in the source account's currency and is converted
+        into the destination account's currency before being deposited.
+        Returns True if the transfer went through, False otherwise.
+        """
+        source = self.get_account(from_number)
+        target = self.get_account(to_number)
+        if source is None or target is None:
+            print("Account not found.")
+            return False
+
+        if source is target:
+            print("Cannot transfer to the same account.")
+            return False
+
+        try:
+            converted = self.fx.convert(amount, source.currency, target.currency)
+        except ValueError as e:
+            print(e)
+            return False
+
+        if not source.withdraw(amount):
+            return False
+
+        target.deposit(converted)
+        print(
+            f"Transferred {amount} {source.currency} from {from_number} "
+            f"to {to_number} as {converted} {target.currency}."
+        )
+        return True
+
+    def get_total_balance(self, currency=None):
+        """
+        Returns the combined balance of all accounts in one currency
+        (the base currency by default).
+        Balances are first summed per currency and each currency total is
+        converted once, so the cost is one addition per account and one
+        conversion per currency rather than one conversion per account.
+        """
+        currency = self.base_currency if currency is None else currency.upper()
+
+        totals = {}
+        for account in self.accounts.values():
+            totals[account.currency] = totals.get(account.currency, 0.0) + account.get_balance()
+
+        convert = self.fx.convert
+        return sum(convert(total, cur, currency) for cur, total in totals.items())
+
@@ -0,0 +1,397 @@
+# batch.py
+# Non-interactive batch mode for SecureBank.
+# Replays a command script or a JSON-lines stream of operations against a Bank
+# without any prompts, buffering output in large chunks and reporting throughput at the end.
+#
+# Script format (one command per line, '#' starts a comment, quote names with spaces):
+#   create savings "Jane Doe" 1001 2.5
+#   create checking "John Doe" 1002 1.0 200      (optional overdraft limit)
+#   create savings "Jean Dupont" 1003 2.0 0 EUR  (optional currency, default USD)
+#   deposit 1001 500
+#   withdraw 1002 20
+#   balance 1001
+#   available 1001
+#   hold 1002 50 [TTL_SECONDS]
+#   capture 1002 1002-H1 [AMOUNT]
+#   release 1002 1002-H1
+#   rate EUR 1.08                                (value of 1 EUR in the base currency)
+#   transfer 1003 1001 100                       (amount in the source currency)
+#   total [CURRENCY]                             (all balances, base currency by default)
+#   verify 1001 [full]                           (check one account's history for tampering)
+#   audit [full]                                 (check the bank-wide ledger)
+#   history 1001
+#   interest 1001
+#   list
+#
+# JSON-lines format (one object per line, may be mixed with script lines):
+#   {"op": "create", "type": "savings", "name": "Jane Doe", "account": "1001", "rate": 2.5}
+#   {"op": "create", "type": "checking", "name": "John Doe", "account": "1002", "fee": 1.0}
+#   {"op": "deposit", "account": "1001", "amount": 500}
+#   {"op": "balance", "account": "1001"}
+#   {"op": "hold", "account": "1002", "amount": 50, "ttl": 300}
+#   {"op": "transfer", "from": "1003", "to": "1001", "amount": 100}
+
+import contextlib
+import io
+import json
+import math
+import shlex
+import sys
+import time
+
+from bank import Bank
+from savings_account import SavingsAccount
+from checking_account import CheckingAccount
+
+
+class BatchError(Exception):
+    """
+    Raised when a batch command is malformed or cannot be executed.
+    """
+
+
+# --------------------------
+# Parsing
+# --------------------------
+def parse_script_line(line):
+    """
+    Convert a whitespace separated script line into an operation dictionary
+    using the same keys as the JSON-lines format.
+    """
+    parts = shlex.split(line)
+    if not parts:
+        raise BatchError("empty command")
+    op = parts[0].lower()
+    args = parts[1:]
+
+    if op == "create":
+        if len(args) not in (4, 5, 6):
+            raise BatchError(
+                "usage: create savings|checking NAME ACCOUNT RATE|FEE [OVERDRAFT [CURRENCY]]"
+            )
+        acc_type, name, acc_num, value = args[:4]
+        key = "rate" if acc_type.lower() == "savings" else "fee"
+        operation = {"op": op, "type": acc_type, "name": name, "account": acc_num, key: value}
+        if len(args) >= 5:
+            operation["overdraft"] = args[4]
+        if len(args) == 6:
+            operation["currency"] = args[5]
+        return operation
+
+    if op in ("deposit", "withdraw"):
+        if len(args) != 2:
+            raise BatchError(f"usage: {op} ACCOUNT AMOUNT")
+        return {"op": op, "account": args[0], "amount": args[1]}
+
+    if op == "transfer":
+        if len(args) != 3:
+            raise BatchError("usage: transfer FROM_ACCOUNT TO_ACCOUNT AMOUNT")
+        return {"op": op, "from": args[0], "to": args[1], "amount": args[2]}
+
+    if op == "rate":
+        if len(args) != 2:
+            raise BatchError("usage: rate CURRENCY RATE")
+        return {"op": op, "currency": args[0], "rate": args[1]}
+
+    if op == "total":
+        if len(args) > 1:
+            raise BatchError("usage: total [CURRENCY]")
+        operation = {"op": op}
+        if args:
+            operation["currency"] = args[0]
+        return operation
+
+    if op == "verify":
+        if len(args) not in (1, 2) or args[1:] not in ([], ["full"]):
+            raise BatchError("usage: verify ACCOUNT [full]")
+        return {"op": op, "account": args[0], "full": len(args) == 2}
+
+    if op == "audit":
+        if args not in ([], ["full"]):
+            raise BatchError("usage: audit [full]")
+        return {"op": op, "full": bool(args)}
+
+    if op == "hold":
+        if len(args) not in (2, 3):
+            raise BatchError("usage: hold ACCOUNT AMOUNT [TTL]")
+        operation = {"op": op, "account": args[0], "amount": args[1]}
+        if len(args) == 3:
+            operation["ttl"] = args[2]
+        return operation
+
+    if op == "capture":
+        if len(args) not in (2, 3):
+            raise BatchError("usage: capture ACCOUNT HOLD_ID [AMOUNT]")
+        operation = {"op": op, "account": args[0], "hold": args[1]}
+        if len(args) == 3:
+            operation["amount"] = args[2]
+        return operation
+
+    if op == "release":
+        if len(args) != 2:
+            raise BatchError("usage: release ACCOUNT HOLD_ID")
+        return {"op": op, "account": args[0], "hold": args[1]}
+
+    if op in ("balance", "available", "history", "interest"):
+        if len(args) != 1:
+            raise BatchError(f"usage: {op} ACCOUNT")
+        return {"op": op, "account": args[0]}
+
+    if op == "list":
+        return {"op": op}
+
+    raise BatchError(f"unknown command '{op}'")
+
+
+def parse_line(line):
+    """
+    Parse one line of input into an operation dictionary.
+    Returns None for blank lines and comments.
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+
+    if line.startswith("{"):
+        try:
+            operation = json.loads(line)
+        except ValueError as e:
+            raise BatchError(f"invalid JSON: {e}")
+        if not isinstance(operation, dict) or "op" not in operation:
+            raise BatchError("JSON command must be an object with an 'op' field")
+        operation["op"] = str(operation["op"]).lower()
+        return operation
+
+    try:
+        return parse_script_line(line)
+    except ValueError as e:
+        raise BatchError(f"invalid command: {e}")
+
+
+# --------------------------
+# Execution
+# --------------------------
+def _require(operation, key):
+    """
+    Fetch a required field from an operation or raise BatchError.
+    """
+    if key not in operation:
+        raise BatchError(f"missing field '{key}'")
+    return operation[key]
+
+
+def _amount(operation, key):
+    """
+    Fetch a required numeric field from an operation.
+    Rejects nan and infinity, which would poison balances permanently.
+    """
+    value = _require(operation, key)
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise BatchError(f"'{key}' must be a number, got {value!r}")
+    if not math.isfinite(number):
+        raise BatchError(f"'{key}' must be a finite number, got {value!r}")
+    return number
+
+
+def _account(bank, operation):
+    """
+    Look up the account named by an operation.
+    """
+    acc_num = str(_require(operation, "account"))
+    account = bank.get_account(acc_num)
+    if account is None:
+        raise BatchError(f"account {acc_num} not found")
+    return account
+
+
+def execute(bank, operation):
+    """
+    Execute a single parsed operation against the bank.
+    Returns True if the operation succeeded, False if the bank rejected it.
+    Raises BatchError for malformed operations.
+    """
+    op = operation["op"]
+
+    if op == "create":
+        acc_type = str(_require(operation, "type")).lower()
+        name = str(_require(operation, "name"))
+        acc_num = str(_require(operation, "account"))
+        overdraft = _amount(operation, "overdraft") if "overdraft" in operation else 0.0
+        if overdraft < 0:
+            raise BatchError("overdraft limit cannot be negative")
+        currency = str(operation.get("currency", bank.base_currency)).upper()
+        if currency not in bank.fx.currencies():
+            raise BatchError(f"no FX rate loaded for {currency}")
+        if acc_type == "savings":
+            account = SavingsAccount(
+                name, acc_num, _amount(operation, "rate"),
+                overdraft_limit=overdraft, currency=currency,
+            )
+        elif acc_type == "checking":
+            account = CheckingAccount(
+                name, acc_num, _amount(operation, "fee"),
+                overdraft_limit=overdraft, currency=currency,
+            )
+        else:
+            raise BatchError(f"invalid account type '{acc_type}'")
+        return bank.add_account(account)
+
+    if op == "deposit":
+        return _account(bank, operation).deposit(_amount(operation, "amount"))
+
+    if op == "withdraw":
+        return _account(bank, operation).withdraw(_amount(operation, "amount"))
+
+    if op == "balance":
+        print(f"Current Balance: {_account(bank, operation).get_balance()}")
+        return True
+
+    if op == "transfer":
+        return bank.transfer(
+            str(_require(operation, "from")), str(_require(operation, "to")),
+            _amount(operation, "amount"),
+        )
+
+    if op == "rate":
+        try:
+            bank.fx.set_rate(str(_require(operation, "currency")), _amount(operation, "rate"))
+        except ValueError as e:
+            raise BatchError(str(e))
+        return True
+
+    if op == "total":
+        currency = operation.get("currency", bank.base_currency)
+        try:
+            total = bank.get_total_balance(currency)
+        except ValueError as e:
+            raise BatchError(str(e))
+        print(f"Total Balance: {total} {str(currency).upper()}")
+        return True
+
+    if op == "verify":
+        account = _account(bank, operation)
+        if not account.verify_history(full=bool(operation.get("full", False))):
+            return False
+        print(f"Account {account.get_account_number()}: history intact.")
+        return True
+
+    if op == "audit":
+        if not bank.verify_ledger(full=bool(operation.get("full", False))):
+            return False
+        print(f"Bank ledger intact ({len(bank.ledger)} postings).")
+        return True
+
+    if op == "available":
+        print(f"Available Balance: {_account(bank, operation).get_available_balance()}")
+        return True
+
+    if op == "hold":
+        account = _account(bank, operation)
+        ttl = _amount(operation, "ttl") if "ttl" in operation else None
+        hold_id = operation.get("hold")
+        return account.place_hold(
+            _amount(operation, "amount"), ttl=ttl,
+            hold_id=None if hold_id is None else str(hold_id),
+        ) is not None
+
+    if op == "capture":
+        account = _account(bank, operation)
+        amount = _amount(operation, "amount") if "amount" in operation else None
+        return account.capture_hold(str(_require(operation, "hold")), amount)
+
+    if op == "release":
+        return _account(bank, operation).release_hold(str(_require(operation, "hold")))
+
+    if op == "history":
+        _account(bank, operation).show_transactions()
+        return True
+
+    if op == "interest":
+        account = _account(bank, operation)
+        if not isinstance(account, SavingsAccount):
+            raise BatchError(f"account {account.get_account_number()} is not a savings account")
+        return account.apply_interest()
+
+    if op == "list":
+        bank.list_accounts()
+        return True
+
+    raise BatchError(f"unknown command '{op}'")
+
+
+def run_batch(stream, bank=None, out=None, verbose=True, flush_size=1 << 20):
+    """
+    Run every command read from a file-like stream against the bank.
+
+    Output produced by the accounts is captured in memory and written to
+    'out' (stdout by default) whenever roughly 'flush_size' characters have
+    built up, so console I/O does not limit throughput and memory stays
+    bounded on long replays. The summary is written once the run finishes.
+    With verbose=False only failures and the summary are written.
+
+    Returns a dictionary with the bank and the run statistics.
+    """
+    if bank is None:
+        bank = Bank()
+    if out is None:
+        out = sys.stdout
+
+    buffer = io.StringIO()
+    succeeded = failed = 0
+
+    start = time.perf_counter()
+    # print() is a no-op while sys.stdout is None, which silences the
+    # account messages entirely when only failures are wanted
+    with contextlib.redirect_stdout(buffer if verbose else None):
+        for line_no, line in enumerate(stream, 1):
+            error = None
+            try:
+                operation = parse_line(line)
+                if operation is None:
+                    continue
+                ok = execute(bank, operation)
+            except BatchError as e:
+                ok = False
+                error = e
+            except Exception as e:
+                # One faulty command must not lose the buffered report
+                ok = False
+                error = f"{type(e).__name__}: {e}"
+
+            if ok:
+                succeeded += 1
+                result = "OK"
+            else:
+                failed += 1
+                result = "FAILED" if error is None else f"FAILED ({error})"
+
+            if verbose or not ok:
+                buffer.write(f"[line {line_no}] {line.strip()} -> {result}\n")
+
+            if buffer.tell() >= flush_size:
+                out.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+    elapsed = time.perf_counter() - start
+
+    total = succeeded + failed
+    rate = total / elapsed if elapsed > 0 else float("inf")
+
+    report = buffer.getvalue() + (
+        "\n------ Batch Summary ------\n"
+        f"Commands: {total}, Succeeded: {succeeded}, Failed: {failed}\n"
+        f"Elapsed: {elapsed:.6f}s, Throughput: {rate:.0f} commands/sec\n"
+        "---------------------------\n"
+    )
+
+    out.write(report)
+
+    return {
+        "bank": bank,
+        "total": total,
+        "succeeded": succeeded,
+        "failed": failed,
+        "elapsed": elapsed,
+    }
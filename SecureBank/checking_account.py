@@ -5,13 +5,14 @@
 from account import Account
 
 class CheckingAccount(Account):
-    def __init__(self, name, account_number, transaction_fee, balance=0.0):
+    def __init__(self, name, account_number, transaction_fee, balance=0.0, overdraft_limit=0.0,
+                 currency="USD"):
         """
         Initialize a Checking Account.
         Inherits attributes from Account.
         Adds a transaction fee which is charged on every withdrawal.
         """
-        super().__init__(name, account_number, balance)
+        super().__init__(name, account_number, balance, overdraft_limit, currency)
         self.transaction_fee = transaction_fee  # Fixed fee deducted per withdrawal
 
     def withdraw(self, amount):
@@ -24,11 +25,11 @@ class CheckingAccount(Account):
         # Check if total amount exceeds balance
         if amount <= 0:
             print("Withdrawal amount must be positive.")
-            return
+            return False
 
-        if total_amount > self.get_balance():
+        if total_amount > self.get_available_balance():
             print("Insufficient funds including transaction fee. Transaction cancelled.")
-            return
+            return False
 
         # Perform withdrawal using the inherited deposit() method logic
         # but manually adjust balance because we add a fee
@@ -44,6 +45,7 @@ class CheckingAccount(Account):
         # Using deposit(-value) is a workaround to modify private variable
         super().withdraw(amount)  # This updates balance and logs withdrawal
         super().withdraw(self.transaction_fee)  # This charges the fee separately
+        return True
 
     def __str__(self):
         """
@@ -53,7 +55,7 @@ class CheckingAccount(Account):
         return (
             f"Checking Account | Holder: {self.name}, "
             f"Account No: {self.get_account_number()}, "
-            f"Balance: {self.get_balance()}, "
+            f"Balance: {self.get_balance()} {self.currency}, "
             f"Transaction Fee: {self.transaction_fee}"
         )
 
@@ -0,0 +1,113 @@
+# fx.py
+# FXRates class holds a locally loaded foreign exchange rate table
+# and converts amounts between currencies for the SecureBank system.
+
+import csv
+import math
+
+class FXRates:
+    def __init__(self, base_currency="USD"):
+        """
+        Initialize an empty rate table.
+        Every rate is stored as the value of one unit of a currency
+        expressed in the base currency (the base itself is always 1.0).
+        """
+        self.base_currency = base_currency.upper()
+        self.__rates = {self.base_currency: 1.0}
+
+        # Cross rates are cached per table version; any rate change bumps the
+        # version and the cache is discarded on the next lookup.
+        self.version = 0
+        self.__cache = {}
+        self.__cache_version = 0
+
+    # --------------------------
+    # Loading rates
+    # --------------------------
+    def set_rate(self, currency, rate):
+        """
+        Set the value of one unit of 'currency' in the base currency.
+        """
+        currency = currency.upper()
+        if currency == self.base_currency:
+            raise ValueError(f"Rate of the base currency {currency} is fixed at 1.0.")
+        rate = float(rate)
+        if not (math.isfinite(rate) and rate > 0):
+            raise ValueError(f"Rate for {currency} must be a positive finite number.")
+
+        self.__rates[currency] = rate
+        self.version += 1
+
+    def load(self, path):
+        """
+        Load rates from a CSV file with 'currency,rate' rows.
+        Blank lines, '#' comments and a 'currency,rate' header are skipped,
+        as is a row for the base currency at 1.0.
+        Returns the number of rates loaded.
+        Raises ValueError naming the line of the first malformed row.
+        """
+        loaded = 0
+        with open(path, newline="") as f:
+            for line_no, row in enumerate(csv.reader(f), 1):
+                if not row or not row[0].strip() or row[0].lstrip().startswith("#"):
+                    continue
+                if len(row) != 2:
+                    raise ValueError(f"{path}, line {line_no}: expected 'currency,rate'.")
+                currency, rate = row[0].strip(), row[1].strip()
+                if currency.lower() == "currency":
+                    continue
+                try:
+                    if currency.upper() == self.base_currency and float(rate) == 1.0:
+                        continue
+                    self.set_rate(currency, float(rate))
+                except ValueError as e:
+                    raise ValueError(f"{path}, line {line_no}: {e}")
+                loaded += 1
+        return loaded
+
+    def currencies(self):
+        """
+        Returns the currencies known to the table.
+        """
+        return list(self.__rates)
+
+    # --------------------------
+    # Conversion
+    # --------------------------
+    def get_rate(self, from_currency, to_currency):
+        """
+        Returns the multiplier that converts 'from_currency' into 'to_currency'.
+        Raises ValueError for a currency missing from the table.
+        """
+        from_currency = from_currency.upper()
+        to_currency = to_currency.upper()
+
+        if self.__cache_version != self.version:
+            self.__cache.clear()
+            self.__cache_version = self.version
+
+        key = (from_currency, to_currency)
+        rate = self.__cache.get(key)
+        if rate is None:
+            rates = self.__rates
+            for currency in key:
+                if currency not in rates:
+                    raise ValueError(f"No FX rate loaded for {currency}.")
+            rate = rates[from_currency] / rates[to_currency]
+            self.__cache[key] = rate
+        return rate
+
+    def convert(self, amount, from_currency, to_currency):
+        """
+        Convert an amount between two currencies.
+        """
+        if from_currency.upper() == to_currency.upper():
+            return amount
+        return amount * self.get_rate(from_currency, to_currency)
+
+    def __str__(self):
+        """
+        String representation of the rate table.
+        """
+        rates = ", ".join(f"{c}={r}" for c, r in self.__rates.items())
+        return f"FX Rates (base {self.base_currency}, version {self.version}): {rates}"
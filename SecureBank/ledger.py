@@ -0,0 +1,309 @@
+# ledger.py
+# Tamper-evident, hash-chained posting history for the SecureBank system.
+# Every posting is hashed together with the hash of the posting before it,
+# so changing any earlier entry breaks every hash that follows. Periodic
+# Merkle checkpoints let an auditor pin the chain and later verify only
+# the entries added since the last checkpoint.
+#
+# Run "python ledger.py [POSTINGS] [WORKERS]" for a throughput benchmark.
+
+import hashlib
+import multiprocessing
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+GENESIS_HASH = bytes(32)
+
+# A checkpoint covers entries [start, end) of a chain.
+# 'root' is the Merkle root of their hashes and 'head' the chain hash at end - 1.
+Checkpoint = namedtuple("Checkpoint", ["start", "end", "root", "head"])
+
+# Below this many entries a process pool costs more than it saves
+PARALLEL_THRESHOLD = 100_000
+
+# Account postings on the bank-wide ledger are this prefix plus the
+# account chain hash, which is always DIGEST_SIZE bytes
+DIGEST_SIZE = 32
+
+
+# --------------------------
+# Hashing helpers
+# --------------------------
+def merkle_root(hashes):
+    """
+    Returns the Merkle root of a list of hashes.
+    An odd node at the end of a level is paired with itself.
+    """
+    if not hashes:
+        return GENESIS_HASH
+
+    sha256 = hashlib.sha256
+    level = list(hashes)
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)]
+    return level[0]
+
+
+def posting_key(account_number):
+    """
+    Returns the prefix that identifies an account's postings on the bank ledger.
+    """
+    return str(account_number).encode() + b"\x00"
+
+
+def _first_broken_link(prev, payloads, hashes, encode, offset):
+    """
+    Recompute a run of chain links starting from the hash 'prev'.
+    Returns the absolute index of the first entry whose stored hash does
+    not match, or None if the whole run is intact.
+    """
+    sha256 = hashlib.sha256
+    for i, (payload, stored) in enumerate(zip(payloads, hashes)):
+        if encode is not None:
+            payload = encode(payload)
+        if sha256(prev + payload).digest() != stored:
+            return offset + i
+        prev = stored
+    return None
+
+
+# Set just before a fork-based pool starts so workers inherit the chain
+# instead of receiving a pickled copy of it
+_FORK_CHAIN = None
+
+
+def _verify_forked_chunk(start, end):
+    """
+    Worker for fork-based pools: verify a slice of the inherited chain.
+    """
+    payloads, hashes, encode = _FORK_CHAIN
+    prev = hashes[start - 1] if start else GENESIS_HASH
+    return _first_broken_link(prev, payloads[start:end], hashes[start:end], encode, start)
+
+
+class HashChain:
+    def __init__(self, checkpoint_interval=1000, encode=None):
+        """
+        Initialize an empty chain.
+        A Merkle checkpoint is taken automatically every 'checkpoint_interval'
+        entries (0 disables automatic checkpoints).
+        'encode' turns a stored payload into bytes for hashing (None if the
+        payloads are already bytes).
+        """
+        self.checkpoint_interval = checkpoint_interval
+        self.__encode = encode
+        self.__payloads = []
+        self.__hashes = []
+        self.__checkpoints = []
+
+    # --------------------------
+    # Appending
+    # --------------------------
+    def append(self, payload):
+        """
+        Add a payload to the chain and return its hash.
+        """
+        data = payload if self.__encode is None else self.__encode(payload)
+        prev = self.__hashes[-1] if self.__hashes else GENESIS_HASH
+        digest = hashlib.sha256(prev + data).digest()
+
+        self.__payloads.append(payload)
+        self.__hashes.append(digest)
+
+        interval = self.checkpoint_interval
+        if interval and len(self.__hashes) % interval == 0:
+            self.checkpoint()
+        return digest
+
+    def checkpoint(self):
+        """
+        Record a Merkle checkpoint over the entries added since the last one.
+        Returns the new checkpoint, or the last one if nothing was added.
+        """
+        start = self.__checkpoints[-1].end if self.__checkpoints else 0
+        end = len(self.__hashes)
+        if start == end and self.__checkpoints:
+            return self.__checkpoints[-1]
+
+        cp = Checkpoint(start, end, merkle_root(self.__hashes[start:end]), self.head())
+        self.__checkpoints.append(cp)
+        return cp
+
+    # --------------------------
+    # Read-only access
+    # --------------------------
+    def __len__(self):
+        return len(self.__payloads)
+
+    def __iter__(self):
+        return iter(self.__payloads)
+
+    def __getitem__(self, index):
+        return self.__payloads[index]
+
+    def head(self):
+        """
+        Returns the hash of the latest entry.
+        """
+        return self.__hashes[-1] if self.__hashes else GENESIS_HASH
+
+    def get_hash(self, index):
+        """
+        Returns the chain hash of one entry.
+        """
+        return self.__hashes[index]
+
+    def get_hashes(self):
+        """
+        Returns a copy of every entry hash, oldest first.
+        """
+        return list(self.__hashes)
+
+    def get_checkpoints(self):
+        """
+        Returns a copy of the checkpoint list.
+        """
+        return list(self.__checkpoints)
+
+    # --------------------------
+    # Verification
+    # --------------------------
+    def find_tampered(self, start=0, end=None):
+        """
+        Recompute links for entries [start, end).
+        Returns the index of the first entry that fails, or None.
+        """
+        if end is None:
+            end = len(self.__hashes)
+        prev = self.__hashes[start - 1] if start else GENESIS_HASH
+        return _first_broken_link(
+            prev, self.__payloads[start:end], self.__hashes[start:end], self.__encode, start
+        )
+
+    def verify(self, checkpoint=None):
+        """
+        Incremental verification.
+        Trusts the given checkpoint (the latest one by default, e.g. as
+        published to an auditor), checks the chain still ends the checkpointed
+        range with the same head hash, then recomputes only the entries added
+        after it.
+        Returns the index of the first tampered entry, or None if intact.
+        """
+        if checkpoint is None:
+            if not self.__checkpoints:
+                return self.find_tampered()
+            checkpoint = self.__checkpoints[-1]
+
+        if checkpoint.end > len(self.__hashes):
+            return len(self.__hashes)
+        if checkpoint.end and self.__hashes[checkpoint.end - 1] != checkpoint.head:
+            return checkpoint.end - 1
+        return self.find_tampered(checkpoint.end)
+
+    def verify_checkpoints(self):
+        """
+        Recompute the Merkle root of every checkpoint.
+        Returns the first checkpoint whose root no longer matches, or None.
+        """
+        for cp in self.__checkpoints:
+            if merkle_root(self.__hashes[cp.start:cp.end]) != cp.root:
+                return cp
+        return None
+
+    def verify_full(self, workers=None):
+        """
+        Full verification of every link, split across a process pool.
+        Every link depends only on its own payload and the stored hash before
+        it, so chunks of the chain are checked independently.
+        Falls back to a single process for small chains or workers=1.
+        Returns the index of the first tampered entry, or None if intact.
+        """
+        global _FORK_CHAIN
+
+        total = len(self.__hashes)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 1 or total < PARALLEL_THRESHOLD:
+            return self.find_tampered()
+
+        # Several chunks per worker keeps the pool busy if chunks finish unevenly
+        chunk = -(-total // (workers * 4))
+        bounds = [(s, min(s + chunk, total)) for s in range(0, total, chunk)]
+
+        # Only rely on fork where it is the platform default; on macOS it is
+        # available but unsafe, so chunks are pickled to the workers instead
+        if multiprocessing.get_start_method() == "fork":
+            _FORK_CHAIN = (self.__payloads, self.__hashes, self.__encode)
+            try:
+                with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork")) as pool:
+                    results = list(pool.map(_verify_forked_chunk, *zip(*bounds)))
+            finally:
+                _FORK_CHAIN = None
+        else:
+            with ProcessPoolExecutor(workers) as pool:
+                futures = [
+                    pool.submit(
+                        _first_broken_link,
+                        self.__hashes[s - 1] if s else GENESIS_HASH,
+                        self.__payloads[s:e], self.__hashes[s:e], self.__encode, s,
+                    )
+                    for s, e in bounds
+                ]
+                results = [f.result() for f in futures]
+
+        broken = [r for r in results if r is not None]
+        return min(broken) if broken else None
+
+
+# --------------------------
+# Benchmark
+# --------------------------
+def _check_intact(result, label):
+    """
+    Raise if a benchmark verification pass reported tampering.
+    """
+    if result is not None:
+        raise RuntimeError(f"{label} verification failed at entry {result}.")
+
+
+def benchmark(postings, workers=None):
+    """
+    Time appending, incremental verification and full verification
+    for a chain of the given size.
+    """
+    chain = HashChain(checkpoint_interval=10_000)
+
+    start = time.perf_counter()
+    append = chain.append
+    for i in range(postings):
+        append(b"%d:Deposited: 1.0" % i)
+    appended = time.perf_counter() - start
+    print(f"Append:           {postings / appended:,.0f} postings/sec ({appended:.2f}s)")
+
+    for i in range(min(5_000, postings)):
+        append(b"new:%d" % i)
+
+    start = time.perf_counter()
+    _check_intact(chain.verify(), "Incremental")
+    print(f"Incremental:      {time.perf_counter() - start:.4f}s")
+
+    start = time.perf_counter()
+    _check_intact(chain.verify_full(workers=1), "Serial")
+    serial = time.perf_counter() - start
+    print(f"Full (serial):    {len(chain) / serial:,.0f} postings/sec ({serial:.2f}s)")
+
+    start = time.perf_counter()
+    _check_intact(chain.verify_full(workers=workers), "Parallel")
+    parallel = time.perf_counter() - start
+    print(f"Full (parallel):  {len(chain) / parallel:,.0f} postings/sec ({parallel:.2f}s)")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    pool_size = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    benchmark(count, pool_size)
@@ -1,8 +1,15 @@
 # main.py
 # Console-based banking application for SecureBank Ltd
 # This file handles all user interaction and menu-driven navigation.
+# Run with --batch FILE (or --batch - for stdin) to replay commands non-interactively.
+# Use --rates FILE to load an FX rate table (CSV of currency,rate) at startup.
+
+import argparse
+import sys
 
 from bank import Bank
+from batch import run_batch
+from fx import FXRates
 from savings_account import SavingsAccount
 from checking_account import CheckingAccount
 
@@ -31,12 +38,13 @@ def account_menu():
     print("5. Back to Main Menu")
     print("--------------------------")
 
-def main():
+def main(bank=None):
     """
     Main function to run the banking application.
     Handles account creation, selection, and transactions.
     """
-    bank = Bank()  # Bank object to manage multiple accounts
+    if bank is None:
+        bank = Bank()  # Bank object to manage multiple accounts
 
     while True:
         display_menu()
@@ -55,14 +63,14 @@ def main():
             # Create Savings Account
             if acc_type == "1":
                 interest = float(input("Enter interest rate: "))
-                account = SavingsAccount(name, acc_num, interest)
+                account = SavingsAccount(name, acc_num, interest, currency=bank.base_currency)
                 bank.add_account(account)
                 print("Savings Account created successfully.")
 
             # Create Checking Account
             elif acc_type == "2":
                 fee = float(input("Enter transaction fee: "))
-                account = CheckingAccount(name, acc_num, fee)
+                account = CheckingAccount(name, acc_num, fee, currency=bank.base_currency)
                 bank.add_account(account)
                 print("Checking Account created successfully.")
 
@@ -120,6 +128,54 @@ def main():
         else:
             print("Invalid option. Please try again.")
 
+def parse_args(argv=None):
+    """
+    Parse command line options.
+    Without --batch the interactive menu is started.
+    """
+    parser = argparse.ArgumentParser(description="SecureBank console application")
+    parser.add_argument(
+        "--batch", metavar="FILE",
+        help="run commands from a script or JSON-lines file ('-' reads stdin)",
+    )
+    parser.add_argument(
+        "--rates", metavar="FILE",
+        help="load FX rates from a CSV file of currency,rate rows",
+    )
+    parser.add_argument(
+        "--base", default="USD",
+        help="base currency for reports and FX rates (default: USD)",
+    )
+    parser.add_argument(
+        "--quiet", action="store_true",
+        help="in batch mode, only report failed commands and the summary",
+    )
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+
+    fx_rates = FXRates(args.base)
+    if args.rates:
+        try:
+            fx_rates.load(args.rates)
+        except (OSError, ValueError) as e:
+            print(f"Could not load FX rates: {e}")
+            sys.exit(1)
+    bank = Bank(fx_rates=fx_rates)
+
+    if args.batch is None:
+        main(bank)
+    elif args.batch == "-":
+        stats = run_batch(sys.stdin, bank=bank, out=sys.stdout, verbose=not args.quiet)
+        sys.exit(1 if stats["failed"] else 0)
+    else:
+        try:
+            stream = open(args.batch)
+        except OSError as e:
+            print(f"Could not open batch file: {e}")
+            sys.exit(1)
+        with stream:
+            stats = run_batch(stream, bank=bank, out=sys.stdout, verbose=not args.quiet)
+        sys.exit(1 if stats["failed"] else 0)
 
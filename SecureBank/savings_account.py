@@ -5,28 +5,37 @@
 from account import Account
 
 class SavingsAccount(Account):
-    def __init__(self, name, account_number, interest_rate, balance=0.0):
+    def __init__(self, name, account_number, interest_rate, balance=0.0, overdraft_limit=0.0,
+                 currency="USD"):
         """
         Initialize a Savings Account.
         Inherits name, account number, and balance from Account.
         Adds interest rate as a unique attribute.
         """
-        super().__init__(name, account_number, balance)
+        super().__init__(name, account_number, balance, overdraft_limit, currency)
         self.interest_rate = interest_rate  # Interest rate stored as percentage (e.g., 2.5 for 2.5%)
 
     def apply_interest(self):
         """
         Apply interest to the account balance.
         Logs the interest applied as a transaction.
+        No interest is paid on a zero or overdrawn balance.
+        Returns True if interest was applied, False otherwise.
         """
         current_balance = self.get_balance()
+        if current_balance <= 0:
+            print("No interest applied: balance is not positive.")
+            return False
+
         interest_amount = current_balance * (self.interest_rate / 100)
 
         # Deposit interest using inherited deposit method
-        super().deposit(interest_amount)
+        if not super().deposit(interest_amount):
+            return False
 
         self.add_transaction(f"Interest Applied: {interest_amount} at rate {self.interest_rate}%")
         print(f"Interest of {interest_amount} added. New balance: {self.get_balance()}")
+        return True
 
     def __str__(self):
         """
@@ -36,7 +45,7 @@ class SavingsAccount(Account):
         return (
             f"Savings Account | Holder: {self.name}, "
             f"Account No: {self.get_account_number()}, "
-            f"Balance: {self.get_balance()}, "
+            f"Balance: {self.get_balance()} {self.currency}, "
             f"Interest Rate: {self.interest_rate}%"
         )
 
@@ -0,0 +1,8 @@
+# conftest.py
+# The SecureBank modules import each other by plain module name,
+# so make the SecureBank directory importable for the tests.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "SecureBank"))
@@ -0,0 +1,124 @@
+# test_account.py
+# Tests for overdraft limits, holds and interest on accounts.
+
+import time
+
+import pytest
+
+from account import Account
+from checking_account import CheckingAccount
+from savings_account import SavingsAccount
+
+
+def test_overdraft_allows_negative_balance_up_to_limit():
+    account = Account("A", "1", 100.0, overdraft_limit=50.0)
+    assert account.withdraw(150.0)
+    assert account.get_balance() == -50.0
+    assert not account.withdraw(0.01)
+
+
+def test_checking_fee_counts_against_overdraft():
+    account = CheckingAccount("A", "1", 1.0, balance=10.0, overdraft_limit=5.0)
+    assert not account.withdraw(15.0)
+    assert account.withdraw(14.0)
+    assert account.get_balance() == -5.0
+
+
+def test_negative_overdraft_limit_is_rejected():
+    with pytest.raises(ValueError):
+        Account("A", "1", overdraft_limit=-50.0)
+
+
+def test_holds_reserve_available_balance():
+    account = Account("A", "1", 100.0, overdraft_limit=20.0)
+    hold = account.place_hold(90.0)
+    assert account.get_available_balance() == 30.0
+    assert account.place_hold(40.0) is None
+    assert not account.withdraw(31.0)
+
+    assert account.capture_hold(hold, 95.0)
+    assert account.get_balance() == 5.0
+    assert account.get_held_amount() == 0.0
+    assert account.get_available_balance() == 25.0
+
+
+def test_release_restores_available_balance():
+    account = Account("A", "1", 100.0)
+    hold = account.place_hold(60.0)
+    assert account.release_hold(hold)
+    assert account.get_available_balance() == 100.0
+    assert not account.release_hold(hold)
+    assert account.get_balance() == 100.0
+
+
+def test_non_positive_ttl_is_rejected():
+    account = Account("A", "1", 100.0)
+    assert account.place_hold(10.0, ttl=0) is None
+    assert account.place_hold(10.0, ttl=-1) is None
+    assert account.get_held_amount() == 0.0
+
+
+def test_capture_after_expiry_fails_cleanly():
+    account = Account("A", "1", 100.0)
+    hold = account.place_hold(10.0, ttl=0.01)
+    time.sleep(0.02)
+    assert not account.capture_hold(hold)
+    assert account.get_balance() == 100.0
+    assert account.get_available_balance() == 100.0
+    assert account.transactions[-1] == f"Hold Expired: 10.0 ({hold})"
+
+
+def test_release_after_expiry_logs_expiry_not_release():
+    account = Account("A", "1", 100.0)
+    hold = account.place_hold(10.0, ttl=0.01)
+    time.sleep(0.02)
+    assert not account.release_hold(hold)
+    assert account.transactions[-1] == f"Hold Expired: 10.0 ({hold})"
+    assert not any(t.startswith("Hold Released") for t in account.transactions)
+
+
+def test_expire_holds_only_drops_lapsed_holds():
+    account = Account("A", "1", 100.0)
+    account.place_hold(10.0, ttl=0.01)
+    kept = account.place_hold(20.0, ttl=60)
+    released = account.place_hold(30.0, ttl=0.01)
+    account.release_hold(released)
+    time.sleep(0.02)
+    assert account.expire_holds() == 1
+    assert account.get_held_amount() == 20.0
+    assert account.capture_hold(kept)
+
+
+def test_interest_skipped_on_overdrawn_savings():
+    account = SavingsAccount("A", "1", 5.0, balance=-50.0, overdraft_limit=100.0)
+    assert not account.apply_interest()
+    assert account.get_balance() == -50.0
+    assert account.transactions == ()
+
+
+def test_interest_applied_on_positive_balance():
+    account = SavingsAccount("A", "1", 10.0, balance=100.0)
+    assert account.apply_interest()
+    assert account.get_balance() == 110.0
+    assert account.transactions[-1] == "Interest Applied: 10.0 at rate 10.0%"
+
+
+def test_generated_hold_id_skips_caller_supplied_ids():
+    account = Account("A", "1", 100.0)
+    assert account.place_hold(10.0, hold_id="1-H1") == "1-H1"
+    account.place_hold(5.0, hold_id="x")
+    generated = account.place_hold(20.0)
+    assert generated not in ("1-H1", "x")
+    assert account.get_held_amount() == 35.0
+
+    assert account.capture_hold("1-H1")
+    assert account.release_hold(generated)
+    assert account.get_held_amount() == 5.0
+    assert account.get_available_balance() == 85.0
+
+
+def test_duplicate_hold_id_is_rejected():
+    account = Account("A", "1", 100.0)
+    account.place_hold(10.0, hold_id="auth")
+    assert account.place_hold(10.0, hold_id="auth") is None
+    assert account.get_held_amount() == 10.0
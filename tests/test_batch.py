@@ -0,0 +1,140 @@
+# test_batch.py
+# Tests for the non-interactive batch mode.
+
+import io
+import os
+import subprocess
+import sys
+
+import batch
+from batch import run_batch
+
+
+def run(script, **kwargs):
+    """
+    Run a script through batch mode and return (stats, report).
+    """
+    out = io.StringIO()
+    stats = run_batch(io.StringIO(script), out=out, **kwargs)
+    return stats, out.getvalue()
+
+
+def test_script_and_json_lines_are_executed():
+    stats, report = run(
+        'create savings "Jane Doe" 1001 2.5\n'
+        '{"op": "deposit", "account": "1001", "amount": 500}\n'
+        "# comment\n"
+        "\n"
+        "withdraw 1001 200\n"
+    )
+    assert stats["total"] == 3
+    assert stats["failed"] == 0
+    assert stats["bank"].get_account("1001").get_balance() == 300
+    assert "Commands: 3, Succeeded: 3, Failed: 0" in report
+
+
+def test_malformed_commands_are_reported_as_failed():
+    stats, report = run(
+        "create savings A 1001 2\n"
+        "bogus 1\n"
+        "deposit 1001\n"
+        "deposit 1001 abc\n"
+        "{not json\n"
+        '{"amount": 5}\n'
+        "deposit 9999 5\n"
+    )
+    assert stats["succeeded"] == 1
+    assert stats["failed"] == 6
+    assert "[line 2] bogus 1 -> FAILED (unknown command 'bogus')" in report
+    assert "account 9999 not found" in report
+
+
+def test_non_finite_amounts_are_rejected():
+    stats, report = run(
+        "create savings A 1001 2\n"
+        "deposit 1001 nan\n"
+        "deposit 1001 inf\n"
+        '{"op": "withdraw", "account": "1001", "amount": "-inf"}\n'
+        "deposit 1001 10\n"
+    )
+    assert stats["failed"] == 3
+    assert "must be a finite number" in report
+    assert stats["bank"].get_account("1001").get_balance() == 10
+
+
+def test_unexpected_exception_does_not_abort_the_run(monkeypatch):
+    original = batch.execute
+
+    def execute(bank, operation):
+        if operation["op"] == "balance":
+            raise KeyError("boom")
+        return original(bank, operation)
+
+    monkeypatch.setattr(batch, "execute", execute)
+    stats, report = run("create savings A 1001 2\nbalance 1001\ndeposit 1001 5\n")
+    assert stats["total"] == 3
+    assert stats["failed"] == 1
+    assert "[line 2] balance 1001 -> FAILED (KeyError: 'boom')" in report
+    assert "------ Batch Summary ------" in report
+
+
+def test_quiet_mode_only_reports_failures():
+    _, report = run("create savings A 1001 2\nwithdraw 1001 5\n", verbose=False)
+    assert "[line 1]" not in report
+    assert "[line 2] withdraw 1001 5 -> FAILED" in report
+    assert "added successfully" not in report
+
+
+def test_hold_commands_and_validation():
+    stats, report = run(
+        "create checking A 1001 1 200\n"
+        '{"op": "create", "type": "savings", "name": "B", "account": "1002", "rate": 1, "overdraft": -50}\n'
+        "hold 1001 50 0\n"
+        "hold 1001 50 0.01\n"
+        "interest 1001\n"
+    )
+    assert stats["succeeded"] == 2
+    assert "overdraft limit cannot be negative" in report
+    assert stats["bank"].get_account("1002") is None
+    assert "[line 3] hold 1001 50 0 -> FAILED" in report
+
+
+def test_interest_reports_failure_on_overdrawn_account():
+    stats, report = run(
+        "create savings A 1001 2 100\n"
+        "withdraw 1001 50\n"
+        "interest 1001\n"
+    )
+    assert "[line 3] interest 1001 -> FAILED" in report
+    assert stats["bank"].get_account("1001").get_balance() == -50
+
+
+def test_output_is_flushed_in_chunks():
+    class Recorder(io.StringIO):
+        def __init__(self):
+            super().__init__()
+            self.writes = 0
+
+        def write(self, text):
+            self.writes += 1
+            return super().write(text)
+
+    out = Recorder()
+    script = "create savings A 1001 2\n" + "deposit 1001 1\n" * 200
+    stats = run_batch(io.StringIO(script), out=out, flush_size=1000)
+    report = out.getvalue()
+    assert stats["succeeded"] == 201
+    assert out.writes > 5
+    assert report.count("-> OK") == 201
+    assert report.rstrip().endswith("---------------------------")
+
+
+def test_missing_batch_file_is_reported(tmp_path):
+    main = os.path.join(os.path.dirname(__file__), "..", "SecureBank", "main.py")
+    result = subprocess.run(
+        [sys.executable, main, "--batch", str(tmp_path / "missing.txt")],
+        capture_output=True, text=True,
+    )
+    assert result.returncode == 1
+    assert "Could not open batch file" in result.stdout
+    assert "Traceback" not in result.stderr
@@ -0,0 +1,115 @@
+# test_fx.py
+# Tests for the FX rate table and multi-currency bank operations.
+
+import contextlib
+import math
+import os
+import subprocess
+import sys
+
+import pytest
+
+from account import Account
+from bank import Bank
+from fx import FXRates
+
+
+def test_conversion_and_cache_follow_rate_changes():
+    fx = FXRates("USD")
+    fx.set_rate("EUR", 1.1)
+    assert math.isclose(fx.convert(10, "EUR", "USD"), 11.0)
+    version = fx.version
+
+    fx.set_rate("EUR", 1.2)
+    assert fx.version == version + 1
+    assert math.isclose(fx.convert(10, "EUR", "USD"), 12.0)
+    assert math.isclose(fx.get_rate("USD", "EUR"), 1 / 1.2)
+
+
+@pytest.mark.parametrize("rate", [0, -1, float("nan"), float("inf")])
+def test_invalid_rates_are_rejected(rate):
+    fx = FXRates("USD")
+    with pytest.raises(ValueError):
+        fx.set_rate("EUR", rate)
+    assert fx.version == 0
+
+
+def test_unknown_currency_raises():
+    with pytest.raises(ValueError):
+        FXRates("USD").convert(1, "EUR", "USD")
+
+
+def test_load_reports_malformed_line(tmp_path):
+    path = tmp_path / "rates.csv"
+    path.write_text("currency,rate\nEUR,1.08\n# comment\nGBP\n")
+    fx = FXRates("USD")
+    with pytest.raises(ValueError, match="line 4"):
+        fx.load(str(path))
+
+    path.write_text("EUR,abc\n")
+    with pytest.raises(ValueError, match="line 1"):
+        fx.load(str(path))
+
+
+def test_main_reports_bad_rates_file(tmp_path):
+    path = tmp_path / "rates.csv"
+    path.write_text("EUR,nan\n")
+    main = os.path.join(os.path.dirname(__file__), "..", "SecureBank", "main.py")
+    result = subprocess.run(
+        [sys.executable, main, "--rates", str(path), "--batch", "-"],
+        input="", capture_output=True, text=True,
+    )
+    assert result.returncode == 1
+    assert "Could not load FX rates" in result.stdout
+    assert "Traceback" not in result.stderr
+
+
+def test_bank_base_currency_must_match_rate_table():
+    with pytest.raises(ValueError):
+        Bank("USD", fx_rates=FXRates("EUR"))
+    assert Bank(fx_rates=FXRates("EUR")).base_currency == "EUR"
+    assert Bank().base_currency == "USD"
+
+
+def test_transfer_converts_and_total_groups_by_currency():
+    bank = Bank("USD")
+    bank.fx.set_rate("EUR", 2.0)
+    with contextlib.redirect_stdout(None):
+        bank.add_account(Account("A", "1", 100.0))
+        bank.add_account(Account("B", "2", 100.0, currency="EUR"))
+        assert bank.transfer("2", "1", 10.0)
+        assert not bank.transfer("2", "1", 1000.0)
+
+    assert bank.get_account("1").get_balance() == 120.0
+    assert bank.get_account("2").get_balance() == 90.0
+    assert bank.get_total_balance() == 300.0
+    assert bank.get_total_balance("eur") == 150.0
+
+
+def test_load_accepts_base_row_at_one(tmp_path):
+    path = tmp_path / "rates.csv"
+    path.write_text("currency,rate\nUSD,1.0\nEUR,1.08\n")
+    fx = FXRates("USD")
+    assert fx.load(str(path)) == 1
+    assert fx.get_rate("EUR", "USD") == 1.08
+
+    path.write_text("USD,1.5\n")
+    with pytest.raises(ValueError, match="line 1"):
+        fx.load(str(path))
+
+
+def test_currency_codes_are_case_insensitive():
+    fx = FXRates("USD")
+    fx.set_rate("EUR", 2.0)
+    assert fx.convert(1, "eur", "USD") == 2.0
+    assert fx.get_rate("usd", "Eur") == 0.5
+    assert fx.convert(3, "eur", "EUR") == 3
+
+
+def test_add_account_rejects_unknown_currency():
+    bank = Bank(fx_rates=FXRates("EUR"))
+    with contextlib.redirect_stdout(None):
+        assert not bank.add_account(Account("A", "1", 10.0))
+        assert bank.add_account(Account("B", "2", 10.0, currency="EUR"))
+    assert bank.get_account("1") is None
+    assert bank.get_total_balance() == 10.0
@@ -0,0 +1,152 @@
+# test_ledger.py
+# Tests for the hash-chained transaction history and the bank-wide ledger.
+
+import contextlib
+import hashlib
+
+import pytest
+
+import ledger
+from account import Account
+from bank import Bank
+from ledger import GENESIS_HASH, HashChain, merkle_root
+
+
+def rewrite(chain, index, payload):
+    """
+    Simulate an attacker who edits one entry and recomputes every hash
+    after it so the chain is internally consistent again.
+    """
+    payloads = chain._HashChain__payloads
+    hashes = chain._HashChain__hashes
+    payloads[index] = payload
+    prev = hashes[index - 1] if index else GENESIS_HASH
+    for i in range(index, len(payloads)):
+        data = payloads[i].encode() if isinstance(payloads[i], str) else payloads[i]
+        prev = hashlib.sha256(prev + data).digest()
+        hashes[i] = prev
+
+
+def make_bank(deposits=10):
+    bank = Bank()
+    with contextlib.redirect_stdout(None):
+        for number in ("1", "2"):
+            account = Account("A", number)
+            bank.add_account(account)
+            for _ in range(deposits):
+                account.deposit(1.0)
+    return bank
+
+
+def test_transactions_are_read_only():
+    account = Account("A", "1")
+    account.add_transaction("note")
+    with pytest.raises(AttributeError):
+        account.transactions.append("forged")
+    with pytest.raises(AttributeError):
+        account.transactions = []
+    assert account.transactions == ("note",)
+
+
+def test_edit_without_rehash_is_detected():
+    chain = HashChain(checkpoint_interval=0)
+    for i in range(10):
+        chain.append(b"%d" % i)
+    chain._HashChain__payloads[4] = b"forged"
+    assert chain.find_tampered() == 4
+    assert chain.verify() == 4
+
+
+def test_incremental_verify_only_checks_after_checkpoint():
+    chain = HashChain(checkpoint_interval=5)
+    for i in range(12):
+        chain.append(b"%d" % i)
+    assert [cp.end for cp in chain.get_checkpoints()] == [5, 10]
+
+    chain._HashChain__payloads[2] = b"forged"
+    assert chain.verify() is None
+    assert chain.find_tampered() == 2
+
+    chain._HashChain__payloads[11] = b"forged"
+    assert chain.verify() == 11
+
+
+def test_rehash_inside_checkpoint_breaks_merkle_root():
+    chain = HashChain(checkpoint_interval=5)
+    for i in range(10):
+        chain.append(b"%d" % i)
+    rewrite(chain, 7, b"forged")
+    assert chain.find_tampered() is None
+    assert chain.verify() == 9
+    assert chain.verify_checkpoints().start == 5
+
+
+def test_merkle_root_of_odd_level():
+    a, b, c = (hashlib.sha256(x).digest() for x in (b"a", b"b", b"c"))
+    ab = hashlib.sha256(a + b).digest()
+    cc = hashlib.sha256(c + c).digest()
+    assert merkle_root([a, b, c]) == hashlib.sha256(ab + cc).digest()
+    assert merkle_root([a]) == a
+
+
+def test_audit_detects_rewritten_and_rehashed_account():
+    bank = make_bank()
+    assert bank.verify_ledger()
+    assert bank.verify_ledger(full=True)
+
+    account = bank.get_account("1")
+    rewrite(account.get_history(), 3, "Deposited: 1000.0")
+    with contextlib.redirect_stdout(None):
+        assert account.verify_history(full=True)
+        assert not bank.verify_ledger()
+        assert not bank.verify_ledger(full=True)
+
+
+def test_default_audit_checks_account_payloads():
+    bank = make_bank()
+    bank.get_account("2").get_history()._HashChain__payloads[-1] = "Deposited: 1000.0"
+    with contextlib.redirect_stdout(None):
+        assert not bank.verify_ledger()
+
+
+def test_postings_before_joining_bank_are_replayed():
+    account = Account("A", "1")
+    with contextlib.redirect_stdout(None):
+        account.deposit(5.0)
+        bank = Bank()
+        bank.add_account(account)
+        account.deposit(5.0)
+    assert len(bank.ledger) == 2
+    assert bank.verify_ledger(full=True)
+
+
+def test_parallel_verify_matches_serial(monkeypatch):
+    monkeypatch.setattr(ledger, "PARALLEL_THRESHOLD", 0)
+    chain = HashChain(checkpoint_interval=0, encode=str.encode)
+    for i in range(5000):
+        chain.append(f"posting {i}")
+    assert chain.verify_full(workers=3) is None
+
+    chain._HashChain__payloads[3217] = "forged"
+    chain._HashChain__payloads[4001] = "forged"
+    assert chain.find_tampered() == 3217
+    assert chain.verify_full(workers=3) == 3217
+
+
+def test_parallel_verify_without_fork_pickles_chunks(monkeypatch):
+    monkeypatch.setattr(ledger, "PARALLEL_THRESHOLD", 0)
+    monkeypatch.setattr(ledger.multiprocessing, "get_start_method", lambda: "spawn")
+    chain = HashChain(checkpoint_interval=0, encode=str.encode)
+    for i in range(2000):
+        chain.append(f"posting {i}")
+    assert chain.verify_full(workers=2) is None
+
+    chain._HashChain__payloads[1500] = "forged"
+    assert chain.verify_full(workers=2) == chain.find_tampered() == 1500
+
+
+def test_benchmark_reports_failed_verification(monkeypatch):
+    monkeypatch.setattr(HashChain, "verify", lambda self, checkpoint=None: 3)
+    with contextlib.redirect_stdout(None):
+        with pytest.raises(RuntimeError, match="entry 3"):
+            ledger.benchmark(10, workers=1)